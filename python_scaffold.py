@@ -7,20 +7,372 @@ A command-line tool to generate standardized Python project architecture.
 
 import os
 import sys
-import argparse
-import shutil
+import time
+from functools import lru_cache
 from pathlib import Path
+from string import Formatter
+from types import SimpleNamespace
+
+
+_CURRENT_YEAR = time.localtime().tm_year
+
+# Whether paths can be resolved relative to a directory descriptor (not on Windows)
+_HAVE_DIR_FD = {os.open, os.mkdir} <= os.supports_dir_fd
+
+_LICENSE_TMPL = """\
+MIT License
+
+Copyright (c) {year} {author}
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+_GITIGNORE_BODY = """\
+# Byte-compiled / optimized / DLL files
+__pycache__/
+*.py[cod]
+*$py.class
+
+# Distribution / packaging
+dist/
+build/
+*.egg-info/
+
+# Unit test / coverage reports
+.coverage
+htmlcov/
+.pytest_cache/
+
+# Environments
+.env
+.venv
+env/
+venv/
+ENV/
+
+# IDE specific files
+.idea/
+.vscode/
+*.swp
+*.swo
+"""
+
+_SETUP_CFG_TMPL = """\
+[metadata]
+name = {project_name}
+description = {description}
+author = {author}
+license = MIT
+license_file = LICENSE
+platforms = unix, linux, osx, win32
+classifiers =
+    Programming Language :: Python :: 3
+    Programming Language :: Python :: 3 :: Only
+    Programming Language :: Python :: 3.6
+    Programming Language :: Python :: 3.7
+    Programming Language :: Python :: 3.8
+    Programming Language :: Python :: 3.9
+
+[options]
+packages =
+    {package_name}
+install_requires =
+python_requires = >=3.6
+zip_safe = no
+"""
+
+_MAKEFILE_TMPL = """\
+.PHONY: clean clean-test clean-pyc clean-build help
+
+help:
+\t@echo "clean - remove all build, test, coverage and Python artifacts"
+\t@echo "clean-build - remove build artifacts"
+\t@echo "clean-pyc - remove Python file artifacts"
+\t@echo "clean-test - remove test and coverage artifacts"
+\t@echo "lint - check style with flake8"
+\t@echo "test - run tests quickly with the default Python"
+\t@echo "coverage - check code coverage quickly with the default Python"
+\t@echo "build - build the package"
+\t@echo "install - install the package to the active Python site-packages"
+
+clean: clean-build clean-pyc clean-test
+
+clean-build:
+\trm -fr build/
+\trm -fr dist/
+\trm -fr .eggs/
+\tfind . -name "*.egg-info" -exec rm -fr {{}} +
+\tfind . -name "*.egg" -exec rm -f {{}} +
+
+clean-pyc:
+\tfind . -name "*.pyc" -exec rm -f {{}} +
+\tfind . -name "*.pyo" -exec rm -f {{}} +
+\tfind . -name "*~" -exec rm -f {{}} +
+\tfind . -name "__pycache__" -exec rm -fr {{}} +
+
+clean-test:
+\trm -fr .coverage
+\trm -fr htmlcov/
+\trm -fr .pytest_cache
+
+lint:
+\tflake8 {package_name} tests
+
+test:
+\tpytest
+
+coverage:
+\tcoverage run --source {package_name} -m pytest
+\tcoverage report -m
+\tcoverage html
+
+build:
+\t{build_command}
+
+install:
+\tpip install .
+"""
+
+_PYPROJECT_TMPL = """\
+[build-system]
+requires = ["setuptools>=61", "wheel"]
+build-backend = "setuptools.build_meta"
+
+[project]
+name = "{toml_project_name}"
+version = "0.1.0"
+description = "{toml_description}"
+readme = "README.md"
+license = {{text = "MIT"}}
+{authors}requires-python = ">=3.7"
+classifiers = [
+    "Programming Language :: Python :: 3",
+    "License :: OSI Approved :: MIT License",
+    "Operating System :: OS Independent",
+]
+dependencies = [
+    # Add your dependencies here
+]
+
+[project.optional-dependencies]
+dev = [
+    "pytest",
+    "coverage",
+    "flake8",
+    "build",
+]
+
+[project.urls]
+Homepage = "https://github.com/{toml_author}/{toml_project_name}"
+
+[tool.setuptools]
+packages = ["{toml_package_name}"]
+"""
+
+# Only the build system; metadata lives in setup.py/setup.cfg (--legacy)
+_LEGACY_PYPROJECT_BODY = """\
+[build-system]
+requires = ["setuptools>=42", "wheel"]
+build-backend = "setuptools.build_meta"
+"""
+
+_SETUP_PY_TMPL = """\
+#!/usr/bin/env python3
+
+from setuptools import setup, find_packages
+
+with open("README.md", "r", encoding="utf-8") as f:
+    long_description = f.read()
+
+setup(
+    name="{project_name}",
+    version="0.1.0",
+    author="{author}",
+    author_email="{email}",
+    description="{description}",
+    long_description=long_description,
+    long_description_content_type="text/markdown",
+    url="https://github.com/{author}/{project_name}",
+    packages=find_packages(),
+    classifiers=[
+        "Programming Language :: Python :: 3",
+        "License :: OSI Approved :: MIT License",
+        "Operating System :: OS Independent",
+    ],
+    python_requires=">=3.6",
+    install_requires=[
+        # Add your dependencies here
+    ],
+)
+"""
+
+_README_TMPL = """\
+# {title}
+
+{description}
+
+## Features
+
+* TODO
+
+## Installation
+
+```bash
+pip install .
+```
+
+## Quick Start
+
+```python
+import {package_name}
+
+# Add example usage
+```
+
+## License
+
+This project is licensed under the MIT License - see the LICENSE file for details.
+"""
+
+_PACKAGE_INIT_TMPL = '''\
+"""Main package for {project_name}."""
+
+__version__ = "0.1.0"
+'''
+
+_TESTS_INIT_TMPL = '''\
+"""Test package for {package_name}."""
+'''
+
+_TEST_MODULE_TMPL = '''\
+"""Tests for `{package_name}` package."""
+
+import pytest
+from {package_name} import __version__
+
+
+def test_version():
+    """Test version is a string."""
+    assert isinstance(__version__, str)
+'''
+
+_DOCS_INDEX_TMPL = """\
+# {title}
+
+{description}
+
+## Installation
+
+```bash
+pip install .
+```
+
+## Usage
+
+```python
+import {package_name}
+```
+"""
+
+# Files written verbatim, as (relative path, UTF-8 contents); encoded once here
+_STATIC_FILES = (
+    (".gitignore", _GITIGNORE_BODY.encode("utf-8")),
+)
+
+_LEGACY_STATIC_FILES = (
+    ("pyproject.toml", _LEGACY_PYPROJECT_BODY.encode("utf-8")),
+)
+
+# Files rendered per project, as (relative path template, contents template)
+_PROJECT_TEMPLATES = (
+    ("{package_name}/__init__.py", _PACKAGE_INIT_TMPL),
+    ("README.md", _README_TMPL),
+    ("LICENSE", _LICENSE_TMPL),
+    ("Makefile", _MAKEFILE_TMPL),
+)
+
+_PACKAGING_TEMPLATES = (
+    ("pyproject.toml", _PYPROJECT_TMPL),
+)
+
+_LEGACY_PACKAGING_TEMPLATES = (
+    ("setup.py", _SETUP_PY_TMPL),
+    ("setup.cfg", _SETUP_CFG_TMPL),
+)
+
+_TESTS_TEMPLATES = (
+    ("tests/__init__.py", _TESTS_INIT_TMPL),
+    ("tests/test_{package_name}.py", _TEST_MODULE_TMPL),
+)
+
+_DOCS_TEMPLATES = (
+    ("docs/index.md", _DOCS_INDEX_TMPL),
+)
+
+
+@lru_cache(maxsize=None)
+def _template_fields(template):
+    """Return the names of the fields a template refers to."""
+    return tuple(sorted({name for _, name, _, _ in Formatter().parse(template) if name}))
+
+
+@lru_cache(maxsize=128)
+def _render(template, values):
+    """Render a template from (field, value) pairs as UTF-8 bytes.
+    
+    Keyed only on the fields the template uses, so e.g. the LICENSE of a
+    batch of projects by the same author is rendered once per process.
+    """
+    return template.format_map(dict(values)).encode("utf-8")
+
+
+# Escapes for characters not allowed raw in a TOML basic ("...") string
+_TOML_ESCAPES = {char: f"\\u{char:04x}" for char in (*range(0x20), 0x7f)}
+_TOML_ESCAPES.update({ord("\\"): "\\\\", ord('"'): '\\"'})
+
+
+def _toml_escape(value):
+    """Escape a value for use inside a TOML basic string."""
+    return value.translate(_TOML_ESCAPES)
+
+
+def _pyproject_authors(author, email):
+    """Return the pyproject.toml ``authors`` line, leaving out empty fields."""
+    entry = ", ".join(f'{key} = "{_toml_escape(value)}"'
+                      for key, value in (("name", author), ("email", email)) if value)
+    return f"authors = [{{{entry}}}]\n" if entry else ""
+
+
+class ProjectExistsError(FileExistsError):
+    """Raised when the project directory to scaffold already exists."""
 
 
 class ProjectScaffolder:
     """Class to generate a standardized Python project structure."""
 
     def __init__(self, project_name, use_tests=True, use_docs=True, use_venv=True, 
-                 author="", email="", description=""):
+                 author="", email="", description="", legacy=False):
         self.project_name = project_name
         self.use_tests = use_tests
         self.use_docs = use_docs
         self.use_venv = use_venv
+        self.legacy = legacy
         self.author = author
         self.email = email
         self.description = description
@@ -29,276 +381,207 @@ class ProjectScaffolder:
         self.package_name = project_name.replace("-", "_").lower()
         
         # Base directory is current directory + project name
-        self.base_dir = os.path.join(os.getcwd(), project_name)
+        self.base_dir = Path.cwd() / project_name
+
+    def _open_base_dir(self):
+        """Return a descriptor for the base directory, or None if unsupported.
+        
+        Creating entries relative to it resolves the base path only once,
+        rather than once per directory or file. The caller closes it.
+        """
+        if not _HAVE_DIR_FD:
+            return None
+        return os.open(self.base_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+
+    def _write_file(self, rel_path, data, dir_fd=None):
+        """Write bytes to a single file under the base directory.
+        
+        The files are small and written in one go, so a raw descriptor is
+        used instead of open(), skipping its text and buffering layers. When
+        dir_fd refers to the base directory, rel_path is opened relative to
+        it instead of resolving the full path again.
+        """
+        path = rel_path if dir_fd is not None else self.base_dir / rel_path
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
     def create_directory_structure(self):
-        """Create the project directory structure."""
+        """Create the project directory structure.
+        
+        Raises ProjectExistsError if the project directory already exists.
+        """
+        # Create base directory; refusing an existing one here (rather than
+        # checking beforehand) avoids a separate stat and a TOCTOU race
+        try:
+            self.base_dir.mkdir(exist_ok=False)
+        except FileExistsError as err:
+            raise ProjectExistsError(err.errno, err.strerror, str(self.base_dir)) from err
+        
         print(f"Creating project: {self.project_name}")
         
-        # Create base directory
-        os.makedirs(self.base_dir, exist_ok=True)
+        # The base directory is fresh, so the leaves can be created directly
+        leaf_dirs = [self.package_name]
+        if self.use_tests:
+            leaf_dirs.append("tests")
+        if self.use_docs:
+            leaf_dirs.append("docs")
         
-        # Create package directory
-        package_dir = os.path.join(self.base_dir, self.package_name)
-        os.makedirs(package_dir, exist_ok=True)
+        dir_fd = self._open_base_dir()
+        try:
+            for leaf in leaf_dirs:
+                if dir_fd is not None:
+                    os.mkdir(leaf, dir_fd=dir_fd)
+                else:
+                    (self.base_dir / leaf).mkdir()
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+    def render_files(self):
+        """Render every enabled file as a list of (relative path, UTF-8 bytes).
         
-        # Create __init__.py in package directory
-        with open(os.path.join(package_dir, "__init__.py"), "w") as f:
-            f.write(f'"""Main package for {self.project_name}."""\n\n')
-            f.write('__version__ = "0.1.0"\n')
+        All per-project decisions are made here, so writing the result is a
+        single branch-free loop.
+        """
+        fields = dict(vars(self), title=self.project_name.title(), year=_CURRENT_YEAR)
         
-        # Create tests directory if requested
+        templates = list(_PROJECT_TEMPLATES)
+        files = list(_STATIC_FILES)
+        if self.legacy:
+            templates += _LEGACY_PACKAGING_TEMPLATES
+            files += _LEGACY_STATIC_FILES
+            fields["build_command"] = "python setup.py sdist bdist_wheel"
+        else:
+            templates += _PACKAGING_TEMPLATES
+            fields["authors"] = _pyproject_authors(self.author, self.email)
+            for name in ("project_name", "package_name", "description", "author"):
+                fields[f"toml_{name}"] = _toml_escape(fields[name])
+            fields["build_command"] = "python -m build"
         if self.use_tests:
-            tests_dir = os.path.join(self.base_dir, "tests")
-            os.makedirs(tests_dir, exist_ok=True)
-            
-            # Create __init__.py in tests directory
-            with open(os.path.join(tests_dir, "__init__.py"), "w") as f:
-                f.write('"""Test package for {self.package_name}."""\n')
-            
-            # Create a basic test file
-            with open(os.path.join(tests_dir, f"test_{self.package_name}.py"), "w") as f:
-                f.write(f'"""Tests for `{self.package_name}` package."""\n\n')
-                f.write('import pytest\n')
-                f.write(f'from {self.package_name} import __version__\n\n\n')
-                f.write('def test_version():\n')
-                f.write('    """Test version is a string."""\n')
-                f.write('    assert isinstance(__version__, str)\n')
-
-        # Create docs directory if requested
+            templates += _TESTS_TEMPLATES
         if self.use_docs:
-            docs_dir = os.path.join(self.base_dir, "docs")
-            os.makedirs(docs_dir, exist_ok=True)
-            
-            # Create a basic docs file
-            with open(os.path.join(docs_dir, "index.md"), "w") as f:
-                f.write(f'# {self.project_name.title()}\n\n')
-                f.write(f'{self.description}\n\n')
-                f.write('## Installation\n\n')
-                f.write('```bash\npip install .\n```\n\n')
-                f.write('## Usage\n\n')
-                f.write('```python\n')
-                f.write(f'import {self.package_name}\n')
-                f.write('```\n')
-
-    def create_setup_files(self):
-        """Create setup.py and related files."""
-        # Create setup.py
-        with open(os.path.join(self.base_dir, "setup.py"), "w") as f:
-            f.write('#!/usr/bin/env python3\n\n')
-            f.write('from setuptools import setup, find_packages\n\n')
-            f.write('with open("README.md", "r", encoding="utf-8") as f:\n')
-            f.write('    long_description = f.read()\n\n')
-            f.write('setup(\n')
-            f.write(f'    name="{self.project_name}",\n')
-            f.write('    version="0.1.0",\n')
-            f.write(f'    author="{self.author}",\n')
-            f.write(f'    author_email="{self.email}",\n')
-            f.write(f'    description="{self.description}",\n')
-            f.write('    long_description=long_description,\n')
-            f.write('    long_description_content_type="text/markdown",\n')
-            f.write(f'    url="https://github.com/{self.author}/{self.project_name}",\n')
-            f.write('    packages=find_packages(),\n')
-            f.write('    classifiers=[\n')
-            f.write('        "Programming Language :: Python :: 3",\n')
-            f.write('        "License :: OSI Approved :: MIT License",\n')
-            f.write('        "Operating System :: OS Independent",\n')
-            f.write('    ],\n')
-            f.write('    python_requires=">=3.6",\n')
-            f.write('    install_requires=[\n')
-            f.write('        # Add your dependencies here\n')
-            f.write('    ],\n')
-            f.write(')\n')
+            templates += _DOCS_TEMPLATES
         
-        # Create pyproject.toml for modern Python packaging
-        with open(os.path.join(self.base_dir, "pyproject.toml"), "w") as f:
-            f.write('[build-system]\n')
-            f.write('requires = ["setuptools>=42", "wheel"]\n')
-            f.write('build-backend = "setuptools.build_meta"\n')
-
-        # Create setup.cfg
-        with open(os.path.join(self.base_dir, "setup.cfg"), "w") as f:
-            f.write('[metadata]\n')
-            f.write('name = {self.project_name}\n')
-            f.write('description = {self.description}\n')
-            f.write('author = {self.author}\n')
-            f.write('license = MIT\n')
-            f.write('license_file = LICENSE\n')
-            f.write('platforms = unix, linux, osx, win32\n')
-            f.write('classifiers =\n')
-            f.write('    Programming Language :: Python :: 3\n')
-            f.write('    Programming Language :: Python :: 3 :: Only\n')
-            f.write('    Programming Language :: Python :: 3.6\n')
-            f.write('    Programming Language :: Python :: 3.7\n')
-            f.write('    Programming Language :: Python :: 3.8\n')
-            f.write('    Programming Language :: Python :: 3.9\n')
-            f.write('\n[options]\n')
-            f.write('packages =\n')
-            f.write('    {self.package_name}\n')
-            f.write('install_requires =\n')
-            f.write('python_requires = >=3.6\n')
-            f.write('zip_safe = no\n')
-
-    def create_readme(self):
-        """Create README.md file."""
-        with open(os.path.join(self.base_dir, "README.md"), "w") as f:
-            f.write(f'# {self.project_name.title()}\n\n')
-            f.write(f'{self.description}\n\n')
-            f.write('## Features\n\n')
-            f.write('* TODO\n\n')
-            f.write('## Installation\n\n')
-            f.write('```bash\n')
-            f.write('pip install .\n')
-            f.write('```\n\n')
-            f.write('## Quick Start\n\n')
-            f.write('```python\n')
-            f.write(f'import {self.package_name}\n\n')
-            f.write('# Add example usage\n')
-            f.write('```\n\n')
-            f.write('## License\n\n')
-            f.write('This project is licensed under the MIT License - see the LICENSE file for details.\n')
-
-    def create_license(self):
-        """Create LICENSE file with MIT License."""
-        with open(os.path.join(self.base_dir, "LICENSE"), "w") as f:
-            f.write('MIT License\n\n')
-            f.write(f'Copyright (c) {self.get_current_year()} {self.author}\n\n')
-            f.write('Permission is hereby granted, free of charge, to any person obtaining a copy\n')
-            f.write('of this software and associated documentation files (the "Software"), to deal\n')
-            f.write('in the Software without restriction, including without limitation the rights\n')
-            f.write('to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n')
-            f.write('copies of the Software, and to permit persons to whom the Software is\n')
-            f.write('furnished to do so, subject to the following conditions:\n\n')
-            f.write('The above copyright notice and this permission notice shall be included in all\n')
-            f.write('copies or substantial portions of the Software.\n\n')
-            f.write('THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n')
-            f.write('IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n')
-            f.write('FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n')
-            f.write('AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n')
-            f.write('LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n')
-            f.write('OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n')
-            f.write('SOFTWARE.\n')
-
-    def create_gitignore(self):
-        """Create .gitignore file."""
-        with open(os.path.join(self.base_dir, ".gitignore"), "w") as f:
-            f.write('# Byte-compiled / optimized / DLL files\n')
-            f.write('__pycache__/\n')
-            f.write('*.py[cod]\n')
-            f.write('*$py.class\n\n')
-            
-            f.write('# Distribution / packaging\n')
-            f.write('dist/\n')
-            f.write('build/\n')
-            f.write('*.egg-info/\n\n')
-            
-            f.write('# Unit test / coverage reports\n')
-            f.write('.coverage\n')
-            f.write('htmlcov/\n')
-            f.write('.pytest_cache/\n\n')
-            
-            f.write('# Environments\n')
-            f.write('.env\n')
-            f.write('.venv\n')
-            f.write('env/\n')
-            f.write('venv/\n')
-            f.write('ENV/\n\n')
-            
-            f.write('# IDE specific files\n')
-            f.write('.idea/\n')
-            f.write('.vscode/\n')
-            f.write('*.swp\n')
-            f.write('*.swo\n')
+        files += [(rel_path.format_map(fields),
+                   _render(template, tuple((name, fields[name])
+                                           for name in _template_fields(template))))
+                  for rel_path, template in templates]
+        return files
+
+    def write_files(self, files):
+        """Write (relative path, bytes) pairs under the base directory."""
+        dir_fd = self._open_base_dir()
+        try:
+            for rel_path, data in files:
+                self._write_file(rel_path, data, dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
 
     def create_venv(self):
         """Create a virtual environment if requested."""
         if self.use_venv:
             print("Creating virtual environment...")
             import venv
-            venv.create(os.path.join(self.base_dir, "venv"), with_pip=True)
-            print("Virtual environment created at ./venv")
-            print("Activate it with:")
+            # Bootstrapping pip (ensurepip) dominates scaffolding time, so it
+            # is left to the user; symlinking avoids copying the interpreter
+            venv.create(self.base_dir / "venv", with_pip=False,
+                        symlinks=(os.name != "nt"))
             if os.name == "nt":  # Windows
-                print(f"cd {self.project_name} && .\\venv\\Scripts\\activate")
+                activate = f"cd {self.project_name} && .\\venv\\Scripts\\activate"
             else:  # Unix/Linux
-                print(f"cd {self.project_name} && source venv/bin/activate")
-
-    def create_makefile(self):
-        """Create a simple Makefile with common commands."""
-        with open(os.path.join(self.base_dir, "Makefile"), "w") as f:
-            f.write('.PHONY: clean clean-test clean-pyc clean-build help\n\n')
-            
-            f.write('help:\n')
-            f.write('\t@echo "clean - remove all build, test, coverage and Python artifacts"\n')
-            f.write('\t@echo "clean-build - remove build artifacts"\n')
-            f.write('\t@echo "clean-pyc - remove Python file artifacts"\n')
-            f.write('\t@echo "clean-test - remove test and coverage artifacts"\n')
-            f.write('\t@echo "lint - check style with flake8"\n')
-            f.write('\t@echo "test - run tests quickly with the default Python"\n')
-            f.write('\t@echo "coverage - check code coverage quickly with the default Python"\n')
-            f.write('\t@echo "build - build the package"\n')
-            f.write('\t@echo "install - install the package to the active Python site-packages"\n\n')
-            
-            f.write('clean: clean-build clean-pyc clean-test\n\n')
-            
-            f.write('clean-build:\n')
-            f.write('\trm -fr build/\n')
-            f.write('\trm -fr dist/\n')
-            f.write('\trm -fr .eggs/\n')
-            f.write('\tfind . -name "*.egg-info" -exec rm -fr {} +\n')
-            f.write('\tfind . -name "*.egg" -exec rm -f {} +\n\n')
-            
-            f.write('clean-pyc:\n')
-            f.write('\tfind . -name "*.pyc" -exec rm -f {} +\n')
-            f.write('\tfind . -name "*.pyo" -exec rm -f {} +\n')
-            f.write('\tfind . -name "*~" -exec rm -f {} +\n')
-            f.write('\tfind . -name "__pycache__" -exec rm -fr {} +\n\n')
-            
-            f.write('clean-test:\n')
-            f.write('\trm -fr .coverage\n')
-            f.write('\trm -fr htmlcov/\n')
-            f.write('\trm -fr .pytest_cache\n\n')
-            
-            f.write('lint:\n')
-            f.write('\tflake8 {self.package_name} tests\n\n')
-            
-            f.write('test:\n')
-            f.write('\tpytest\n\n')
-            
-            f.write('coverage:\n')
-            f.write('\tcoverage run --source {self.package_name} -m pytest\n')
-            f.write('\tcoverage report -m\n')
-            f.write('\tcoverage html\n\n')
-            
-            f.write('build:\n')
-            f.write('\tpython setup.py sdist bdist_wheel\n\n')
-            
-            f.write('install:\n')
-            f.write('\tpip install .\n')
-
-    def get_current_year(self):
-        """Get current year for license."""
-        from datetime import datetime
-        return datetime.now().year
+                activate = f"cd {self.project_name} && source venv/bin/activate"
+            print("\n".join([
+                "Virtual environment created at ./venv",
+                "Activate it with:",
+                activate,
+                "Then install pip into it with: python -m ensurepip --upgrade",
+            ]))
 
     def scaffold(self):
         """Run the entire scaffolding process."""
+        files = self.render_files()
         self.create_directory_structure()
-        self.create_setup_files()
-        self.create_readme()
-        self.create_license()
-        self.create_gitignore()
-        self.create_makefile()
+        self.write_files(files)
         
         if self.use_venv:
             self.create_venv()
         
-        print(f"\nProject {self.project_name} created successfully!")
-        print(f"Get started with: cd {self.project_name}")
+        print(f"\nProject {self.project_name} created successfully!\n"
+              f"Get started with: cd {self.project_name}")
 
 
-def main():
-    """Main function to handle command-line arguments and run scaffolding."""
+# Command-line options: flag -> (destination, takes a value)
+_CLI_OPTIONS = {
+    "--no-tests": ("no_tests", False),
+    "--no-docs": ("no_docs", False),
+    "--no-venv": ("no_venv", False),
+    "--legacy": ("legacy", False),
+    "-a": ("author", True),
+    "--author": ("author", True),
+    "-e": ("email", True),
+    "--email": ("email", True),
+    "-d": ("description", True),
+    "--description": ("description", True),
+}
+
+_CLI_DEFAULTS = {
+    "no_tests": False,
+    "no_docs": False,
+    "no_venv": False,
+    "legacy": False,
+    "author": "",
+    "email": "",
+    "description": "A Python package",
+}
+
+
+def parse_args_fast(argv):
+    """Parse a plain command line without importing argparse.
+    
+    Returns None for anything outside the common forms (--help, unknown or
+    abbreviated options, missing values, ...) so that build_parser() can
+    handle it with its usual help and error messages.
+    """
+    args = dict(_CLI_DEFAULTS, project_name=None)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg.startswith("-"):
+            flag, has_value, value = arg.partition("=")
+            if flag not in _CLI_OPTIONS:
+                return None
+            dest, takes_value = _CLI_OPTIONS[flag]
+            if not takes_value:
+                if has_value:
+                    return None
+                value = True
+            elif not has_value:
+                i += 1
+                if i == len(argv) or argv[i].startswith("-"):
+                    return None
+                value = argv[i]
+            args[dest] = value
+        elif args["project_name"] is None:
+            args["project_name"] = arg
+        else:
+            return None
+        i += 1
+    
+    if args["project_name"] is None:
+        return None
+    return SimpleNamespace(**args)
+
+
+def build_parser():
+    """Build the full argparse parser used for --help and errors."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Generate a standardized Python project structure."
     )
@@ -325,28 +608,36 @@ def main():
     
     parser.add_argument(
         "-a", "--author", 
-        default="", 
+        default=_CLI_DEFAULTS["author"], 
         help="Author name for project metadata"
     )
     
     parser.add_argument(
         "-e", "--email", 
-        default="", 
+        default=_CLI_DEFAULTS["email"], 
         help="Author email for project metadata"
     )
     
     parser.add_argument(
         "-d", "--description", 
-        default="A Python package", 
+        default=_CLI_DEFAULTS["description"], 
         help="Short description of the project"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--legacy", 
+        action="store_true", 
+        help="Generate setup.py and setup.cfg instead of a PEP 621 pyproject.toml"
+    )
     
-    # Check if project directory already exists
-    if os.path.exists(os.path.join(os.getcwd(), args.project_name)):
-        print(f"Error: Directory {args.project_name} already exists.")
-        sys.exit(1)
+    return parser
+
+
+def main():
+    """Main function to handle command-line arguments and run scaffolding."""
+    args = parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
     
     # Create scaffolder and run
     scaffolder = ProjectScaffolder(
@@ -357,9 +648,14 @@ def main():
         author=args.author,
         email=args.email,
         description=args.description,
+        legacy=args.legacy,
     )
     
-    scaffolder.scaffold()
+    try:
+        scaffolder.scaffold()
+    except ProjectExistsError:
+        print(f"Error: Directory {args.project_name} already exists.")
+        sys.exit(1)
 
 
 if __name__ == "__main__":